@@ -38,14 +38,26 @@ main.plugins.age.personality_x = 10
 main.plugins.age.personality_y = 100
 # New: Progress bar length (cells inside the bar, default 5, clamped 1–20)
 main.plugins.age.progress_bar_length = 5
+# Save state every N epochs (decay and new titles save immediately)
+main.plugins.age.save_every = 50
+# Handshakes save at most once per this many seconds; bursts are coalesced
+main.plugins.age.save_interval = 30
 """
 
 import os
+import sys
+import bisect
 import json
 import logging
 import time
 import random
 import threading
+import queue
+import types
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 import pwnagotchi
 import pwnagotchi.plugins as plugins
@@ -115,6 +127,10 @@ class Age(plugins.Plugin):
         111_111: "Omega Cipherlord"
     }
 
+    NUMBER_UNITS = ('', 'K', 'M', 'B', 'T')
+    TRAIN_EVERY = 10    # epochs per train epoch
+    EVENT_EVERY = 100   # epochs per random event / milestone check
+
     def __init__(self):
         # Default UI positions (x, y)
         self.default_positions = {
@@ -134,6 +150,7 @@ class Age(plugins.Plugin):
         self.data_path = '/root/age_strength.json'
         self.log_path = '/root/network_points.log'
         self.handshake_dir = '/home/pi/handshakes'
+        self.handshake_dir_mtime = None  # mtime of handshake_dir at last scan
 
         # Configurable settings
         self.decay_interval = 50
@@ -156,6 +173,17 @@ class Age(plugins.Plugin):
         self.show_personality = False  # default False to avoid clutter
         # Progress bar (UI)
         self.progress_bar_length = 5   # default number of cells inside the bar
+        self._build_bar_cache()
+        self._last_ui = {}         # last value passed to ui.set per element
+        self._last_ui_inputs = {}  # raw counters the UI values were last derived from
+        # Persistence: flush to disk every N epochs, and after handshakes at most
+        # once per save_interval seconds (decay and new titles save immediately)
+        self.save_every = 50
+        self.save_interval = 30
+        self._last_save_ts = float('-inf')  # time.monotonic() of the last snapshot
+        self._flush_pending = False         # handshake state waiting for _maybe_flush
+        # Bumped on every persisted-state mutation; saves are skipped when unchanged
+        self._version = 0
 
         # Achievement tracking
         self.prev_age_title = "Unborn"
@@ -171,10 +199,44 @@ class Age(plugins.Plugin):
         self.personality_points = {'aggro': 0, 'stealth': 0, 'scholar': 0}
         self.night_owl_handshakes = 0
         self.enc_types_captured = set()
+        self._cached_hour = 0
+        self._last_hour_check = float('-inf')
+        self._build_points_cache()
+        self._crypto_king_awarded = False
+
+        # Epochs left until the next train epoch / random event (replaces modulo checks)
+        self._reset_epoch_countdowns()
+
+        # Sorted thresholds + parallel title lists for bisect lookups
+        self._build_threshold_cache()
+
+        # Persisted fields, refreshed in place by save_data(). enc_types_captured is
+        # kept as a sorted list shadow that is only rebuilt when a new type appears.
+        self._save_template = {
+            'epochs': 0, 'train_epochs': 0, 'points': 0, 'handshakes': 0,
+            'handshake_dir_mtime': None, 'last_active': 0,
+            'prev_age': self.prev_age_title, 'prev_strength': self.prev_strength_title,
+            'streak': 0, 'night_owl_handshakes': 0, 'enc_types_captured': [],
+            'crypto_king': False, 'personality_aggro': 0, 'personality_stealth': 0,
+            'personality_scholar': 0,
+        }
 
         # Thread safety for persistence
         self.data_lock = threading.Lock()
 
+        # Background writer: save_data() hands a snapshot over and returns at once.
+        # The single-slot queue coalesces bursts; only the newest snapshot is written.
+        self._pending_save = None      # (version, data) waiting for the writer
+        self._saved_version = 0        # version of the last snapshot handed out
+        self._written_version = 0      # version of the last snapshot written to disk
+        self._write_lock = threading.Lock()
+        self._save_q = queue.Queue(maxsize=1)
+        threading.Thread(target=self._save_worker, name='age-save', daemon=True).start()
+
+        # Handshake log, kept open (line-buffered) for the plugin's lifetime
+        self._log_fh = None
+        self._log_lock = threading.Lock()
+
     # ------------------------------------------------------------------
     # Lifecycle
     # ------------------------------------------------------------------
@@ -194,16 +256,93 @@ class Age(plugins.Plugin):
         except (TypeError, ValueError):
             pbl = self.progress_bar_length
         self.progress_bar_length = max(1, min(20, pbl))
+        self._build_bar_cache()
 
+        try:
+            self.save_every = max(1, int(self.options.get('save_every', self.save_every)))
+        except (TypeError, ValueError):
+            pass
+        try:
+            self.save_interval = max(0.0, float(self.options.get('save_interval', self.save_interval)))
+        except (TypeError, ValueError):
+            pass
+
+        self._build_threshold_cache()
+        self._build_points_cache()
         self.load_data()
+        self._reset_epoch_countdowns()
         self.initialize_handshakes()
 
+        try:
+            self._log_fh = open(self.log_path, 'a', buffering=1)
+        except Exception as e:
+            logging.error(f"[Age] Could not open handshake log: {e}")
+
+    def on_unload(self, ui):
+        """Flush unsaved or still-queued state synchronously and close the log."""
+        self.save_data(sync=True)
+        with self._log_lock:
+            if self._log_fh:
+                try:
+                    self._log_fh.close()
+                except Exception:
+                    pass
+                self._log_fh = None
+
+    def _reset_epoch_countdowns(self):
+        """Align the periodic countdowns used by on_epoch with the current epoch count."""
+        self._to_train = self.TRAIN_EVERY - self.epochs % self.TRAIN_EVERY
+        self._to_event = self.EVENT_EVERY - self.epochs % self.EVENT_EVERY
+
+    def _build_points_cache(self):
+        """Lower-case the points map once so handshakes match regardless of key case."""
+        self._points_map_lower = {sys.intern(str(k).lower()): v for k, v in self.points_map.items()}
+        self._enc_types_target = frozenset(self._points_map_lower)
+
+    def _build_threshold_cache(self):
+        """
+        Freeze the title maps and pre-sort their thresholds.
+
+        The maps are read-only after this (MappingProxyType), so the sorted arrays
+        and memoized titles can never go stale. To change them, assign new maps
+        and call this again. Keys are coerced to int since config.toml tables
+        arrive with string keys.
+        """
+        self.age_titles = types.MappingProxyType(
+            {int(t): title for t, title in self.age_titles.items()})
+        self.strength_titles = types.MappingProxyType(
+            {int(t): title for t, title in self.strength_titles.items()})
+        self._age_thresholds_asc = sorted(self.age_titles)
+        self._age_values = [self.age_titles[t] for t in self._age_thresholds_asc]
+        self._strength_thresholds_asc = sorted(self.strength_titles)
+        self._strength_values = [self.strength_titles[t] for t in self._strength_thresholds_asc]
+        # (counter, title) memo for the getters; reset since the maps may have changed
+        self._age_title_cache = (None, None)
+        self._strength_title_cache = (None, None)
+        # (low, high) epoch range for which the cached next threshold is valid
+        self._next_threshold_cache = (1, 0, None)
+        # Counters at which a title can next change; 0 forces the first check
+        self._next_age_change = 0
+        self._next_strength_change = 0
+
     def initialize_handshakes(self):
-        """Initialize handshake count based on existing .pcap files."""
+        """Initialize handshake count based on existing .pcap files.
+
+        The scan is skipped when the directory mtime matches the one recorded
+        at the last scan, i.e. no files were added or removed since.
+        """
         try:
             if self.handshake_count == 0 and os.path.isdir(self.handshake_dir):
-                existing = [f for f in os.listdir(self.handshake_dir) if f.endswith('.pcap')]
-                self.handshake_count = len(existing)
+                mtime = os.stat(self.handshake_dir).st_mtime
+                if mtime == self.handshake_dir_mtime:
+                    return
+                with os.scandir(self.handshake_dir) as it:
+                    self.handshake_count = sum(
+                        1 for e in it
+                        if e.name.endswith('.pcap') and e.is_file(follow_symlinks=False)
+                    )
+                self.handshake_dir_mtime = mtime
+                self._version += 1
                 logging.info(f"[Age] Initialized with {self.handshake_count} handshakes")
                 self.save_data()
         except Exception as e:
@@ -213,20 +352,24 @@ class Age(plugins.Plugin):
     # Titles & UI
     # ------------------------------------------------------------------
     def get_age_title(self):
-        """Determine age title based on epochs."""
-        thresholds = sorted(self.age_titles.keys(), reverse=True)
-        for t in thresholds:
-            if self.epochs >= t:
-                return self.age_titles[t]
-        return "Unborn"
+        """Determine age title based on epochs (memoized per epoch count)."""
+        epochs = self.epochs
+        if self._age_title_cache[0] == epochs:
+            return self._age_title_cache[1]
+        i = bisect.bisect_right(self._age_thresholds_asc, epochs) - 1
+        title = self._age_values[i] if i >= 0 else "Unborn"
+        self._age_title_cache = (epochs, title)
+        return title
 
     def get_strength_title(self):
-        """Determine strength title based on train_epochs."""
-        thresholds = sorted(self.strength_titles.keys(), reverse=True)
-        for t in thresholds:
-            if self.train_epochs >= t:
-                return self.strength_titles[t]
-        return "Untrained"
+        """Determine strength title based on train_epochs (memoized per train epoch count)."""
+        train_epochs = self.train_epochs
+        if self._strength_title_cache[0] == train_epochs:
+            return self._strength_title_cache[1]
+        i = bisect.bisect_right(self._strength_thresholds_asc, train_epochs) - 1
+        title = self._strength_values[i] if i >= 0 else "Untrained"
+        self._strength_title_cache = (train_epochs, title)
+        return title
 
     def on_ui_setup(self, ui):
         """Set up UI elements with configurable positions."""
@@ -235,6 +378,10 @@ class Age(plugins.Plugin):
             y = self.options.get(f"{element}_y", self.default_positions[element][1])
             return (int(x), int(y))
 
+        # Elements are (re)created below, so forget what was last drawn
+        self._last_ui = {}
+        self._last_ui_inputs = {}
+
         positions = {key: get_position(key) for key in self.default_positions if key != 'stars'}
 
         ui.add_element('Age', LabeledValue(
@@ -259,28 +406,58 @@ class Age(plugins.Plugin):
                 position=positions['personality'], label_font=fonts.Bold, text_font=fonts.Medium))
 
     def on_ui_update(self, ui):
-        """Update UI elements with current values."""
-        ui.set('Age', self.get_age_title())
-        ui.set('Strength', self.get_strength_title())
-        ui.set('Points', self.abrev_number(self.network_points))
-
-        # Progress bar for next age title
-        next_threshold = self.get_next_age_threshold()
-        if next_threshold:
-            progress = max(0.0, min(1.0, self.epochs / float(next_threshold)))
-            ui.set('Progress', self.render_progress_bar(progress))
-        else:
-            ui.set('Progress', '[MAX]')
+        """Update UI elements, recomputing each only when its source counter changed."""
+        inputs = self._last_ui_inputs
+
+        epochs = self.epochs
+        if inputs.get('epochs') != epochs:
+            inputs['epochs'] = epochs
+            self._ui_set(ui, 'Age', self.get_age_title())
+
+            # Progress bar for next age title
+            next_threshold = self.get_next_age_threshold()
+            if next_threshold:
+                progress = max(0.0, min(1.0, epochs / float(next_threshold)))
+                self._ui_set(ui, 'Progress', self.render_progress_bar(progress))
+            else:
+                self._ui_set(ui, 'Progress', '[MAX]')
+
+        train_epochs = self.train_epochs
+        if inputs.get('train_epochs') != train_epochs:
+            inputs['train_epochs'] = train_epochs
+            self._ui_set(ui, 'Strength', self.get_strength_title())
+
+        points = self.network_points
+        if inputs.get('points') != points:
+            inputs['points'] = points
+            self._ui_set(ui, 'Points', self.abrev_number(points))
 
         if self.show_personality:
-            ui.set('Personality', self.get_dominant_personality())
+            pp = self.personality_points
+            key = (pp['aggro'], pp['stealth'], pp['scholar'])
+            if inputs.get('personality') != key:
+                inputs['personality'] = key
+                self._ui_set(ui, 'Personality', self.get_dominant_personality())
+
+    def _ui_set(self, ui, key, value):
+        """Only push a value to the UI when it differs from what was last set."""
+        if self._last_ui.get(key) != value:
+            ui.set(key, value)
+            self._last_ui[key] = value
 
     def get_next_age_threshold(self):
-        """Get the next age title threshold."""
-        thresholds = sorted(self.age_titles.keys())
-        for t in thresholds:
-            if self.epochs < t:
-                return t
+        """Get the next age title threshold (cached until epochs leave its range)."""
+        epochs = self.epochs
+        low, high, cached = self._next_threshold_cache
+        if low <= epochs < high:
+            return cached
+        thresholds = self._age_thresholds_asc
+        i = bisect.bisect_right(thresholds, epochs)
+        low = thresholds[i - 1] if i > 0 else float('-inf')
+        if i < len(thresholds):
+            self._next_threshold_cache = (low, thresholds[i], thresholds[i])
+            return thresholds[i]
+        self._next_threshold_cache = (low, float('inf'), None)
         return None  # Max level reached
 
     # ------------------------------------------------------------------
@@ -311,7 +488,8 @@ class Age(plugins.Plugin):
         return random.choice(messages)
 
     def check_achievements(self, agent):
-        """Check and announce new age or strength achievements."""
+        """Check and announce new age or strength achievements. Returns True if any fired."""
+        achieved = False
         current_age = self.get_age_title()
         current_strength = self.get_strength_title()
 
@@ -320,12 +498,25 @@ class Age(plugins.Plugin):
             agent.view().set('status', f"✹{current_age} Achieved! {self.random_motivational_quote()}")
             logging.info(f"[Age] New age title: {current_age}")
             self.prev_age_title = current_age
+            achieved = True
 
         if current_strength != self.prev_strength_title:
             agent.view().set('face', faces.MOTIVATED)
             agent.view().set('status', f"✦Evolved to {current_strength}!")
             logging.info(f"[Age] New strength title: {current_strength}")
             self.prev_strength_title = current_strength
+            achieved = True
+
+        self._next_age_change = self._threshold_after(self._age_thresholds_asc, self.epochs)
+        self._next_strength_change = self._threshold_after(
+            self._strength_thresholds_asc, self.train_epochs)
+        return achieved
+
+    @staticmethod
+    def _threshold_after(thresholds, value):
+        """First threshold strictly above value, or infinity past the last title."""
+        i = bisect.bisect_right(thresholds, value)
+        return thresholds[i] if i < len(thresholds) else float('inf')
 
     def apply_decay(self, agent):
         """Apply decay to network points based on inactivity."""
@@ -342,28 +533,41 @@ class Age(plugins.Plugin):
                 agent.view().set('status', self.random_inactivity_message(points_lost))
                 logging.info(f"[Age] Applied decay: lost {points_lost} points")
                 self.last_active_epoch = self.epochs
+                self._version += 1
                 self.save_data()
 
     def on_epoch(self, agent, epoch, epoch_data):
         """Handle epoch events."""
-        self.epochs += 1
-        if self.epochs % 10 == 0:
+        epochs = self.epochs = self.epochs + 1
+        self._to_train -= 1
+        if not self._to_train:
+            self._to_train = self.TRAIN_EVERY
             self.train_epochs += 1
             self.personality_points['scholar'] += 1
 
-        logging.debug(f"[Age] Epoch {self.epochs}, Points: {self.network_points}")
+        logging.debug("[Age] Epoch %d, Points: %d", epochs, self.network_points)
 
+        self._version += 1
         self.apply_decay(agent)
-        self.check_achievements(agent)
-
-        if self.epochs % 100 == 0:
+        # Titles only change when a counter reaches its next threshold
+        achieved = False
+        if epochs >= self._next_age_change or self.train_epochs >= self._next_strength_change:
+            achieved = self.check_achievements(agent)
+
+        self._to_event -= 1
+        if not self._to_event:
+            self._to_event = self.EVENT_EVERY
             self.handle_random_event(agent)
             self.age_checkpoint(agent)
 
-        self.save_data()
+        # Batch epoch-only changes; save_data() is a no-op if decay just saved
+        if achieved or epochs % self.save_every == 0:
+            self.save_data()
+        elif self._flush_pending:
+            self._maybe_flush()
 
     def handle_random_event(self, agent):
-        """Trigger a random event with 5% chance every 100 epochs."""
+        """Trigger a random event with 5% chance every EVENT_EVERY epochs."""
         try:
             if random.random() < 0.05:
                 events = [
@@ -379,7 +583,7 @@ class Age(plugins.Plugin):
             logging.error(f"[Age] handle_random_event error: {e}")
 
     def age_checkpoint(self, agent):
-        """Display milestone message every 100 epochs."""
+        """Display milestone message every EVENT_EVERY epochs."""
         try:
             view = agent.view()
             view.set('face', faces.HAPPY)
@@ -403,58 +607,74 @@ class Age(plugins.Plugin):
                 logging.warning(f"[Age] AP is not a dict: {type(ap)}")
                 return
 
-            enc = (ap.get('encryption', '') or '').lower()
+            enc = ap.get('encryption') or ''
+            if not enc.islower():  # usually already lower-case; skip the copy then
+                enc = enc.lower()
+            # Interned so map/set probes against the pre-interned keys hit by identity
+            enc = sys.intern(enc)
             essid = ap.get('essid', 'unknown')
-            bssid = (ap.get('bssid') or '').lower()
 
             # Base points
-            points = self.points_map.get(enc, 1)
+            points = self._points_map_lower.get(enc, 1)
+
+            # Hot fields are read once into locals and written back together below
+            view = agent.view()
+            streak = self.streak + 1
+            bonus_points = 0
 
             # Streak bonus
-            self.streak += 1
             streak_threshold = 5
             streak_bonus = 1.2
-            if self.streak >= streak_threshold:
+            if streak >= streak_threshold:
                 points = int(points * streak_bonus)
-                agent.view().set('status', f"Streak bonus! +{int((streak_bonus - 1) * 100)}% points")
+                view.set('status', f"Streak bonus! +{int((streak_bonus - 1) * 100)}% points")
 
             # Random event multiplier
-            if self.active_event and self.event_handshakes_left > 0:
+            left = self.event_handshakes_left
+            if self.active_event and left > 0:
                 points = int(points * self.event_multiplier)
-                self.event_handshakes_left -= 1
-                if self.event_handshakes_left == 0:
+                left -= 1
+                self.event_handshakes_left = left
+                if left == 0:
                     self.active_event = None
                     self.event_multiplier = 1.0
 
-            # Apply points & core bookkeeping
-            self.network_points += int(points)
-            self.handshake_count += 1
-            self.last_active_epoch = self.epochs
-            self.last_handshake_enc = enc
-            self.personality_points['aggro'] += 1
-
             # Secret achievements
-            current_hour = time.localtime().tm_hour
+            current_hour = self._current_hour()
             if 2 <= current_hour < 4:
                 self.night_owl_handshakes += 1
                 if self.night_owl_handshakes == 10:
-                    agent.view().set('status', "Achievement Unlocked: Night Owl!")
-                    self.network_points += 50
+                    view.set('status', "Achievement Unlocked: Night Owl!")
+                    bonus_points += 50
+
+            captured = self.enc_types_captured
+            if enc not in captured:
+                captured.add(enc)
+                self._save_template['enc_types_captured'] = sorted(captured)
+            if not self._crypto_king_awarded and captured >= self._enc_types_target:
+                self._crypto_king_awarded = True
+                view.set('status', "Achievement Unlocked: Crypto King!")
+                bonus_points += 100
 
-            self.enc_types_captured.add(enc)
-            if self.enc_types_captured == set(self.points_map.keys()):
-                agent.view().set('status', "Achievement Unlocked: Crypto King!")
-                self.network_points += 100
+            # Apply points & core bookkeeping
+            self.streak = streak
+            self.network_points += int(points) + bonus_points
+            self.handshake_count += 1
+            self.last_active_epoch = self.epochs
+            self.last_handshake_enc = enc
+            self.personality_points['aggro'] += 1
+            self._version += 1
 
             # Log handshake
-            try:
-                with open(self.log_path, 'a') as f:
-                    f.write(f"{time.time()},{essid},{enc},{points}\n")
-            except Exception:
-                pass
+            with self._log_lock:
+                if self._log_fh:
+                    try:
+                        self._log_fh.write(f"{time.time()},{essid},{enc},{points}\n")
+                    except Exception:
+                        pass
 
-            logging.info(f"[Age] Handshake: {essid}, enc: {enc}, points: {points}, streak: {self.streak}")
-            self.save_data()
+            logging.info(f"[Age] Handshake: {essid}, enc: {enc}, points: {points}, streak: {streak}")
+            self._maybe_flush()
 
         except Exception as e:
             logging.error(f"[Age] Handshake error: {str(e)}")
@@ -465,51 +685,126 @@ class Age(plugins.Plugin):
     def load_data(self):
         """Load saved data from JSON file."""
         try:
-            if os.path.exists(self.data_path):
-                with open(self.data_path, 'r') as f:
-                    data = json.load(f)
-                    self.epochs = data.get('epochs', 0)
-                    self.train_epochs = data.get('train_epochs', 0)
-                    self.network_points = data.get('points', 0)
-                    self.handshake_count = data.get('handshakes', 0)
-                    self.last_active_epoch = data.get('last_active', 0)
-                    self.prev_age_title = data.get('prev_age', self.get_age_title())
-                    self.prev_strength_title = data.get('prev_strength', self.get_strength_title())
-                    self.streak = data.get('streak', 0)
-                    self.night_owl_handshakes = data.get('night_owl_handshakes', 0)
-                    self.enc_types_captured = set(data.get('enc_types_captured', []))
-                    for trait in ['aggro', 'stealth', 'scholar']:
-                        self.personality_points[trait] = data.get(f'personality_{trait}', 0)
+            try:
+                f = open(self.data_path, 'r')
+            except FileNotFoundError:
+                return  # fresh install, keep defaults
+            with f:
+                data = json.load(f)
+            get = data.get
+            self.epochs = get('epochs', 0)
+            self.train_epochs = get('train_epochs', 0)
+            self.network_points = get('points', 0)
+            self.handshake_count = get('handshakes', 0)
+            self.handshake_dir_mtime = get('handshake_dir_mtime')
+            self.last_active_epoch = get('last_active', 0)
+            self.prev_age_title = get('prev_age') or self.get_age_title()
+            self.prev_strength_title = get('prev_strength') or self.get_strength_title()
+            self.streak = get('streak', 0)
+            self.night_owl_handshakes = get('night_owl_handshakes', 0)
+            enc = get('enc_types_captured')
+            self.enc_types_captured = set(map(sys.intern, enc)) if enc else set()
+            self._save_template['enc_types_captured'] = sorted(self.enc_types_captured)
+            # Older saves lack the flag; infer it so the bonus isn't paid out again
+            self._crypto_king_awarded = get(
+                'crypto_king', self.enc_types_captured >= self._enc_types_target)
+            for trait in ('aggro', 'stealth', 'scholar'):
+                self.personality_points[trait] = get(f'personality_{trait}', 0)
         except Exception as e:
             logging.error(f"[Age] Load error: {str(e)}")
 
-    def save_data(self):
-        """Save current data to JSON file with thread safety."""
-        data = {
-            'epochs': self.epochs,
-            'train_epochs': self.train_epochs,
-            'points': self.network_points,
-            'handshakes': self.handshake_count,
-            'last_active': self.last_active_epoch,
-            'prev_age': self.get_age_title(),
-            'prev_strength': self.get_strength_title(),
-            'streak': self.streak,
-            'night_owl_handshakes': self.night_owl_handshakes,
-            'enc_types_captured': list(self.enc_types_captured),
-            'personality_aggro': self.personality_points['aggro'],
-            'personality_stealth': self.personality_points['stealth'],
-            'personality_scholar': self.personality_points['scholar'],
-        }
+    def save_data(self, sync=False):
+        """
+        Snapshot current data and queue it for the background writer.
+        With sync=True the snapshot is written on the calling thread instead.
+        Does nothing if no state changed since the last snapshot (or, for
+        sync, since the last successful write).
+        """
+        version = self._version
+        if version == (self._written_version if sync else self._saved_version):
+            return
+
+        t = self._save_template
+        t['epochs'] = self.epochs
+        t['train_epochs'] = self.train_epochs
+        t['points'] = self.network_points
+        t['handshakes'] = self.handshake_count
+        t['handshake_dir_mtime'] = self.handshake_dir_mtime
+        t['last_active'] = self.last_active_epoch
+        t['prev_age'] = self.get_age_title()
+        t['prev_strength'] = self.get_strength_title()
+        t['streak'] = self.streak
+        t['night_owl_handshakes'] = self.night_owl_handshakes
+        t['crypto_king'] = self._crypto_king_awarded
+        t['personality_aggro'] = self.personality_points['aggro']
+        t['personality_stealth'] = self.personality_points['stealth']
+        t['personality_scholar'] = self.personality_points['scholar']
+        # The writer thread serializes later, so it gets a (cheap, C-level) shallow copy
+        data = t.copy()
+        self._last_save_ts = time.monotonic()
+        self._flush_pending = False
         with self.data_lock:
+            self._saved_version = version
+            snapshot = (version, data)
+            if sync:
+                self._pending_save = None
+            else:
+                self._pending_save = snapshot
+        if sync:
+            self._write_data(*snapshot)
+            return
+
+        try:
+            self._save_q.put_nowait(True)
+        except queue.Full:
+            pass  # worker is already due to pick up the newest snapshot
+
+    def _maybe_flush(self):
+        """Save now unless the last save is under save_interval seconds old; then defer."""
+        if time.monotonic() - self._last_save_ts >= self.save_interval:
+            self.save_data()
+        else:
+            self._flush_pending = True
+
+    def _save_worker(self):
+        """Write queued snapshots to disk off the epoch/handshake threads."""
+        while True:
+            self._save_q.get()
+            with self.data_lock:
+                snapshot, self._pending_save = self._pending_save, None
+            if snapshot is not None:
+                self._write_data(*snapshot)
+
+    def _write_data(self, version, data):
+        """Atomically write a snapshot to the JSON file, never replacing a newer one."""
+        with self._write_lock:
+            if version <= self._written_version:
+                return
             try:
-                with open(self.data_path, 'w') as f:
-                    json.dump(data, f, indent=2)
+                # Write to a temp file and swap it in so a power cut never leaves a truncated file
+                if orjson is not None:
+                    payload = orjson.dumps(data)
+                else:
+                    payload = json.dumps(data, separators=(",", ":")).encode('utf-8')
+                tmp_path = self.data_path + '.tmp'
+                with open(tmp_path, 'wb') as f:
+                    f.write(payload)
+                os.replace(tmp_path, self.data_path)
+                self._written_version = version
             except Exception as e:
                 logging.error(f"[Age] Save error: {str(e)}")
 
     # ------------------------------------------------------------------
     # Misc helpers
     # ------------------------------------------------------------------
+    def _current_hour(self):
+        """Local hour of day, re-read from the clock at most once a minute."""
+        now = time.time()
+        if now - self._last_hour_check > 60:
+            self._cached_hour = time.localtime(now).tm_hour
+            self._last_hour_check = now
+        return self._cached_hour
+
     def get_dominant_personality(self):
         if not any(self.personality_points.values()):
             return "Neutral"
@@ -517,23 +812,30 @@ class Age(plugins.Plugin):
         return dominant.capitalize()
 
     def abrev_number(self, num):
-        for unit in ['', 'K', 'M', 'B']:
-            if abs(num) < 1000:
-                try:
-                    return f"{num:.1f}{unit}".rstrip('.0')
-                except Exception:
-                    return f"{num}{unit}"
-            num /= 1000.0
-        return f"{num:.1f}T"  # trillions
+        """Abbreviate a point count, e.g. 1500 -> '1.5K', 10000 -> '10K'."""
+        if num == 0:
+            return "0"
+        mag = min(4, (len(str(int(abs(num)))) - 1) // 3)
+        if not mag:
+            return str(int(num))
+        scaled = num / (1000 ** mag)
+        if abs(scaled) >= 999.95 and mag < 4:  # would round up to "1000.0"
+            mag += 1
+            scaled /= 1000
+        text = f"{scaled:.1f}"
+        if text.endswith('.0'):
+            text = text[:-2]
+        return text + self.NUMBER_UNITS[mag]
+
+    def _build_bar_cache(self):
+        """Pre-render every fill level of the progress bar for the configured length."""
+        length = max(1, int(self.progress_bar_length))
+        self._bar_cache = ['|' + ('▥' * i) + (' ' * (length - i)) + '|' for i in range(length + 1)]
 
     def render_progress_bar(self, progress: float) -> str:
         """
-        Build the Age progress bar using the configured length.
+        Return the Age progress bar using the configured length.
         progress is 0.0–1.0.
         """
-        length = int(self.progress_bar_length)
-        if length < 1:
-            length = 1
         pct = max(0.0, min(1.0, float(progress)))
-        filled = int(pct * length)
-        return '|' + ('▥' * filled) + (' ' * (length - filled)) + '|'
+        return self._bar_cache[int(pct * (len(self._bar_cache) - 1))]